@@ -10,21 +10,836 @@ This is the main application file that handles:
 - Template context processors
 """
 
-from flask import Flask, render_template, redirect, url_for, flash, request, session, jsonify
+from flask import Flask, render_template, redirect, url_for, flash, request, session, g, abort
+from flask.sessions import SecureCookieSessionInterface
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
+from flask_caching import Cache
+from flask_compress import Compress
 from flask_wtf import FlaskForm
 from wtforms import StringField, PasswordField, TextAreaField, SelectField, FloatField, IntegerField, BooleanField
 from wtforms.validators import DataRequired, Email, Length, EqualTo, Optional, NumberRange
-from werkzeug.utils import secure_filename
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, insert, delete, select, bindparam, text, event, inspect
+from sqlalchemy.orm import joinedload, selectinload, load_only
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from jinja2 import FileSystemBytecodeCache
 from datetime import datetime, timedelta
+from functools import wraps
+import hashlib
 import os
 import random
 import string
 
 # Import configuration and models
 from config import Config
-from models import db, User, Product, Order, OrderItem, CartItem, WishlistItem
+from models import db, User, Product, Order, OrderItem, CartItem, WishlistItem, dummy_password_check
+
+# Cache extension (configured via Config.CACHE_*)
+cache = Cache()
+
+# Response compression (gzip/brotli negotiated per request)
+compress = Compress()
+
+# Flask-Login, configured once at import; the factory only binds it
+login_manager = LoginManager()
+login_manager.login_view = 'login'
+login_manager.login_message = 'Please log in to access this page.'
+login_manager.login_message_category = 'info'
+
+
+@login_manager.user_loader
+def load_user(user_id):
+    """Load user by ID for Flask-Login.
+
+    db.session.get() is an identity-map lookup, so repeated
+    current_user access within a request never re-queries.
+    """
+    return db.session.get(User, int(user_id))
+
+
+class Blake2SessionInterface(SecureCookieSessionInterface):
+    """Sign session cookies with blake2b instead of the sha1 default.
+
+    The cookie is verified on every request; blake2b is both faster in
+    CPython and a stronger digest than sha1.
+    """
+    digest_method = staticmethod(hashlib.blake2b)
+
+def admin_required(f):
+    """Route decorator: require a logged-in admin, else bounce home.
+
+    Replaces the is_admin check repeated at the top of every admin view.
+    """
+    @wraps(f)
+    @login_required
+    def wrapper(*args, **kwargs):
+        if not current_user.is_admin:
+            flash('Admin access required!', 'danger')
+            return redirect(url_for('index'))
+        return f(*args, **kwargs)
+    return wrapper
+
+
+# Static form choices, built once at import time instead of per request
+CATEGORY_CHOICES = (
+    ('shoes', 'Shoes'),
+    ('clothing', 'Clothing')
+)
+PAYMENT_METHOD_CHOICES = (
+    ('cod', 'Cash on Delivery'),
+    ('card', 'Credit/Debit Card')
+)
+
+# Whitelists as frozensets: built once, O(1) membership on hot paths
+VALID_CATEGORIES = frozenset(value for value, _ in CATEGORY_CHOICES)
+VALID_ORDER_STATUSES = frozenset(
+    ('pending', 'processing', 'shipped', 'delivered', 'cancelled')
+)
+
+# Remote-image detection prefixes, built once instead of a fresh
+# tuple literal per call
+_URL_PREFIXES = ('http://', 'https://')
+
+# Columns a product card needs in listing pages; skips loading the
+# long description/meta text columns per row (use with load_only)
+PRODUCT_CARD_COLUMNS = (
+    Product.name, Product.price, Product.original_price, Product.category,
+    Product.image, Product.stock, Product.created_at
+)
+
+
+# Default sample catalog, built once at import as plain column
+# dicts; the seeder copies entries before use
+SAMPLE_PRODUCTS = (
+    dict(
+        name='Traditional Mojari',
+        description='Handcrafted leather mojaris with traditional embroidery. Perfect for weddings and festive occasions.',
+        price=2499,
+        original_price=2999,
+        category='shoes',
+        subcategory='Mojari',
+        brand='JUTTA LAGANI',
+        color='Maroon',
+        size='6,7,8,9,10',
+        material='Genuine Leather',
+        stock=50,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1542291026-7eec264c27ff?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Urban Jutti',
+        description='Modern fusion juttis with contemporary design. Comfortable for daily wear.',
+        price=1899,
+        original_price=2299,
+        category='shoes',
+        subcategory='Jutti',
+        brand='JUTTA LAGANI',
+        color='Gold',
+        size='6,7,8,9,10,11',
+        material='Synthetic Leather',
+        stock=35,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1514996937319-344454492b37?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Kolhapuri Chappal',
+        description='Traditional Kolhapuri chappals handcrafted by skilled artisans. Durable and stylish.',
+        price=1599,
+        category='shoes',
+        subcategory='Kolhapuri',
+        brand='JUTTA LAGANI',
+        color='Brown',
+        size='7,8,9,10,11',
+        material='Leather',
+        stock=40,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1460353581641-37baddab0fa2?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Loafers Party Wear',
+        description='Elegant loafers for party wear. Features embroidered traditional motifs.',
+        price=3299,
+        original_price=3999,
+        category='shoes',
+        subcategory='Loafers',
+        brand='JUTTA LAGANI',
+        color='Black',
+        size='7,8,9,10,11',
+        material='Premium Leather',
+        stock=25,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1491553895911-0055eca6402d?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Sports Sneakers',
+        description='Comfortable sneakers with ethnic prints. Perfect for casual outings.',
+        price=2199,
+        category='shoes',
+        subcategory='Sneakers',
+        brand='JUTTA LAGANI',
+        color='Multi',
+        size='6,7,8,9,10',
+        material='Canvas',
+        stock=60,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1525966222134-fcfa99b8ae77?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Royal Velvet Jutti',
+        description='Premium velvet jutti with detailed zari embroidery for festive wear.',
+        price=2799,
+        original_price=3399,
+        category='shoes',
+        subcategory='Jutti',
+        brand='JUTTA LAGANI',
+        color='Navy',
+        size='6,7,8,9,10',
+        material='Velvet',
+        stock=28,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1528701800489-20be9c5f6f3a?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Classic Ethnic Loafers',
+        description='Slip-on loafers with handcrafted finish, suitable for formal occasions.',
+        price=3599,
+        original_price=4299,
+        category='shoes',
+        subcategory='Loafers',
+        brand='JUTTA LAGANI',
+        color='Tan',
+        size='7,8,9,10,11',
+        material='Genuine Leather',
+        stock=22,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1549298916-b41d501d3772?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Festive Kolhapuri Premium',
+        description='Traditional Kolhapuri with cushioned sole and artisan-crafted straps.',
+        price=2399,
+        category='shoes',
+        subcategory='Kolhapuri',
+        brand='JUTTA LAGANI',
+        color='Brown',
+        size='6,7,8,9,10',
+        material='Leather',
+        stock=34,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1494496195158-c3becb4f2475?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Handwoven Bridal Mojari',
+        description='Wedding-ready mojari with handwoven detailing and cushioned insole for comfort.',
+        price=3899,
+        original_price=4599,
+        category='shoes',
+        subcategory='Mojari',
+        brand='JUTTA LAGANI',
+        color='Ivory',
+        size='6,7,8,9,10',
+        material='Leather',
+        stock=18,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1573100925118-870b8efc799d?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Embroidered Slip-On Jutti',
+        description='Elegant slip-on jutti with floral embroidery, ideal for festive occasions.',
+        price=2599,
+        original_price=3099,
+        category='shoes',
+        subcategory='Jutti',
+        brand='JUTTA LAGANI',
+        color='Wine',
+        size='6,7,8,9,10',
+        material='Textile',
+        stock=30,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1600185365483-26d7a4cc7519?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Heritage Peshawari Sandal',
+        description='Traditional peshawari sandal with reinforced sole and artisan finish.',
+        price=2999,
+        original_price=3599,
+        category='shoes',
+        subcategory='Sandal',
+        brand='JUTTA LAGANI',
+        color='Brown',
+        size='7,8,9,10,11',
+        material='Genuine Leather',
+        stock=26,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1531312267126-822c7d45d6a4?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Desert Craft Loafers',
+        description='Hand-finished loafers with stitched detailing and soft padded sole.',
+        price=3499,
+        original_price=4099,
+        category='shoes',
+        subcategory='Loafers',
+        brand='JUTTA LAGANI',
+        color='Camel',
+        size='7,8,9,10,11',
+        material='Leather',
+        stock=24,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1560769629-975ec94e6a86?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Regal Wedding Mojari',
+        description='Premium wedding mojari with antique zari and comfort insole.',
+        price=4299,
+        original_price=5099,
+        category='shoes',
+        subcategory='Mojari',
+        brand='JUTTA LAGANI',
+        color='Gold',
+        size='6,7,8,9,10',
+        material='Leather',
+        stock=16,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1608256246200-53e635b5b65f?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Heritage Thread Jutti',
+        description='Thread-embroidered jutti inspired by classic North Indian motifs.',
+        price=2699,
+        original_price=3199,
+        category='shoes',
+        subcategory='Jutti',
+        brand='JUTTA LAGANI',
+        color='Rust',
+        size='6,7,8,9,10',
+        material='Textile',
+        stock=29,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1543163521-1bf539c55dd2?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Urban Ethnic Slip-On',
+        description='Everyday slip-on with ethnic pattern band and lightweight feel.',
+        price=2199,
+        original_price=2699,
+        category='shoes',
+        subcategory='Slip-On',
+        brand='JUTTA LAGANI',
+        color='Grey',
+        size='7,8,9,10',
+        material='Canvas',
+        stock=38,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1465453869711-7e174808ace9?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Comfort Fusion Sneakers',
+        description='Fusion sneakers with breathable upper and extra arch support.',
+        price=3199,
+        original_price=3899,
+        category='shoes',
+        subcategory='Sneakers',
+        brand='JUTTA LAGANI',
+        color='White',
+        size='6,7,8,9,10,11',
+        material='Mesh',
+        stock=42,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1542291026-7eec264c27ff?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Artisan Leather Mule',
+        description='Backless leather mule with hand-burnished finish for quick wear.',
+        price=2899,
+        original_price=3399,
+        category='shoes',
+        subcategory='Mule',
+        brand='JUTTA LAGANI',
+        color='Tan',
+        size='7,8,9,10',
+        material='Leather',
+        stock=21,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1582588678413-dbf45f4823e9?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Midnight Party Loafers',
+        description='Gloss-finish party loafers with elegant silhouette for evening events.',
+        price=3899,
+        original_price=4599,
+        category='shoes',
+        subcategory='Loafers',
+        brand='JUTTA LAGANI',
+        color='Black',
+        size='7,8,9,10,11',
+        material='Patent Leather',
+        stock=19,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1614252369475-531eba835eb1?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Classic Brown Brogues',
+        description='Traditional brogue detailing blended with modern comfort.',
+        price=3599,
+        original_price=4299,
+        category='shoes',
+        subcategory='Brogues',
+        brand='JUTTA LAGANI',
+        color='Brown',
+        size='7,8,9,10,11',
+        material='Leather',
+        stock=27,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1614252235316-8c857d38b5f4?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Gold Festive Khussa',
+        description='Festive khussa with metallic detailing for traditional occasions.',
+        price=3099,
+        original_price=3699,
+        category='shoes',
+        subcategory='Khussa',
+        brand='JUTTA LAGANI',
+        color='Gold',
+        size='6,7,8,9,10',
+        material='Synthetic Leather',
+        stock=23,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1525966222134-fcfa99b8ae77?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Printed Canvas Jutti',
+        description='Colorful printed jutti for everyday ethnic-casual styling.',
+        price=1999,
+        original_price=2499,
+        category='shoes',
+        subcategory='Jutti',
+        brand='JUTTA LAGANI',
+        color='Multi',
+        size='6,7,8,9,10',
+        material='Canvas',
+        stock=44,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1463100099107-aa0980c362e6?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Kurta Set - Festive',
+        description='Beautiful kurta set with dupatta. Perfect for festive occasions.',
+        price=3499,
+        original_price=4299,
+        category='clothing',
+        subcategory='Kurta Set',
+        brand='JUTTA LAGANI',
+        color='Maroon',
+        size='S,M,L,XL,XXL',
+        material='Silk Blend',
+        stock=30,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1521572163474-6864f9cf17ab?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Indo-Western Sherwani',
+        description='Modern sherwani with traditional touch. Ideal for groom wear.',
+        price=8999,
+        original_price=10999,
+        category='clothing',
+        subcategory='Sherwani',
+        brand='JUTTA LAGANI',
+        color='Cream',
+        size='S,M,L,XL,XXL',
+        material='Silk',
+        stock=15,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1593030761757-71fae45fa0e7?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Palazzo Suit',
+        description='Elegant palazzo suit with printed design. Comfortable and stylish.',
+        price=2799,
+        category='clothing',
+        subcategory='Palazzo',
+        brand='JUTTA LAGANI',
+        color='Blue',
+        size='S,M,L,XL',
+        material='Cotton',
+        stock=45,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1483985988355-763728e1935b?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Anarkali Dress',
+        description='Royal anarkali dress with heavy work. Perfect for celebrations.',
+        price=4599,
+        original_price=5499,
+        category='clothing',
+        subcategory='Anarkali',
+        brand='JUTTA LAGANI',
+        color='Red',
+        size='S,M,L,XL',
+        material='Georgette',
+        stock=20,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1496747611176-843222e1e57c?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Lehenga Choli',
+        description='Traditional lehenga with embroidered blouse. Bridal collection.',
+        price=6999,
+        original_price=8999,
+        category='clothing',
+        subcategory='Lehenga',
+        brand='JUTTA LAGANI',
+        color='Pink',
+        size='S,M,L,XL',
+        material='Silk',
+        stock=10,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1529139574466-a303027c1d8b?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Printed Cotton Kurti',
+        description='Daily-wear cotton kurti with breathable fabric and minimal prints.',
+        price=1899,
+        original_price=2299,
+        category='clothing',
+        subcategory='Kurti',
+        brand='JUTTA LAGANI',
+        color='Mustard',
+        size='S,M,L,XL',
+        material='Cotton',
+        stock=52,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1434389677669-e08b4cac3105?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Embroidered Waistcoat Set',
+        description='Festive waistcoat set with subtle embroidery for weddings and parties.',
+        price=4299,
+        original_price=4999,
+        category='clothing',
+        subcategory='Waistcoat',
+        brand='JUTTA LAGANI',
+        color='Olive',
+        size='M,L,XL,XXL',
+        material='Silk Blend',
+        stock=18,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1445205170230-053b83016050?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Contemporary Pathani Suit',
+        description='Modern pathani suit with comfort fit and premium texture.',
+        price=5199,
+        original_price=6099,
+        category='clothing',
+        subcategory='Pathani',
+        brand='JUTTA LAGANI',
+        color='Charcoal',
+        size='M,L,XL,XXL',
+        material='Rayon Blend',
+        stock=20,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1469334031218-e382a71b716b?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Silk Festive Kurta',
+        description='Premium silk kurta with subtle patterns for festive gatherings.',
+        price=3799,
+        original_price=4499,
+        category='clothing',
+        subcategory='Kurta',
+        brand='JUTTA LAGANI',
+        color='Royal Blue',
+        size='M,L,XL,XXL',
+        material='Silk',
+        stock=24,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1489987707025-afc232f7ea0f?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Linen Nehru Jacket',
+        description='Lightweight linen Nehru jacket that pairs well with kurtas and shirts.',
+        price=2899,
+        original_price=3499,
+        category='clothing',
+        subcategory='Jacket',
+        brand='JUTTA LAGANI',
+        color='Beige',
+        size='M,L,XL',
+        material='Linen',
+        stock=32,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1591047139829-d91aecb6caea?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Embroidered Anarkali Gown',
+        description='Floor-length embroidered anarkali gown for weddings and celebrations.',
+        price=6299,
+        original_price=7599,
+        category='clothing',
+        subcategory='Anarkali',
+        brand='JUTTA LAGANI',
+        color='Emerald',
+        size='S,M,L,XL',
+        material='Georgette',
+        stock=14,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1464863979621-258859e62245?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Handblock Printed Kurta',
+        description='Soft handblock-printed kurta designed for all-day comfort.',
+        price=2499,
+        original_price=2999,
+        category='clothing',
+        subcategory='Kurta',
+        brand='JUTTA LAGANI',
+        color='Indigo',
+        size='S,M,L,XL',
+        material='Cotton',
+        stock=36,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1503342217505-b0a15ec3261c?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Festive Chikankari Kurta',
+        description='Elegant chikankari kurta crafted for celebrations and family events.',
+        price=3299,
+        original_price=3899,
+        category='clothing',
+        subcategory='Kurta',
+        brand='JUTTA LAGANI',
+        color='Off White',
+        size='M,L,XL,XXL',
+        material='Cotton Silk',
+        stock=22,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1524504388940-b1c1722653e1?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Velvet Sherwani Set',
+        description='Royal velvet sherwani set with premium buttons and contrast stole.',
+        price=10999,
+        original_price=12999,
+        category='clothing',
+        subcategory='Sherwani',
+        brand='JUTTA LAGANI',
+        color='Burgundy',
+        size='M,L,XL,XXL',
+        material='Velvet',
+        stock=12,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1592878849122-5c3ad22e1a6b?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Casual Cotton Pathani',
+        description='Relaxed-fit cotton pathani with clean lines and breathable fabric.',
+        price=2999,
+        original_price=3599,
+        category='clothing',
+        subcategory='Pathani',
+        brand='JUTTA LAGANI',
+        color='Slate',
+        size='M,L,XL',
+        material='Cotton',
+        stock=28,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1475180098004-ca77a66827be?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Zari Border Saree',
+        description='Classic saree with shimmering zari border for festive elegance.',
+        price=5599,
+        original_price=6699,
+        category='clothing',
+        subcategory='Saree',
+        brand='JUTTA LAGANI',
+        color='Magenta',
+        size='Free Size',
+        material='Silk Blend',
+        stock=17,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1610030469983-98e550d6193c?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Embroidered Palazzo Set Plus',
+        description='Premium embroidered palazzo set with matching dupatta.',
+        price=4999,
+        original_price=5899,
+        category='clothing',
+        subcategory='Palazzo',
+        brand='JUTTA LAGANI',
+        color='Teal',
+        size='S,M,L,XL',
+        material='Georgette',
+        stock=20,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1487412947147-5cebf100ffc2?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Asymmetric Indo Jacket',
+        description='Asymmetric Indo-western jacket for modern ceremonial looks.',
+        price=4699,
+        original_price=5599,
+        category='clothing',
+        subcategory='Jacket',
+        brand='JUTTA LAGANI',
+        color='Navy',
+        size='M,L,XL',
+        material='Silk Blend',
+        stock=15,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1617137968427-85924c800a22?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Pastel Kurta Pajama',
+        description='Pastel kurta pajama set designed for daytime functions and comfort.',
+        price=3199,
+        original_price=3899,
+        category='clothing',
+        subcategory='Kurta Set',
+        brand='JUTTA LAGANI',
+        color='Mint',
+        size='S,M,L,XL',
+        material='Cotton Linen',
+        stock=30,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1509631179647-0177331693ae?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Royal Banarasi Lehenga',
+        description='Luxury banarasi lehenga set with rich weaving and festive shine.',
+        price=12999,
+        original_price=15499,
+        category='clothing',
+        subcategory='Lehenga',
+        brand='JUTTA LAGANI',
+        color='Royal Red',
+        size='S,M,L,XL',
+        material='Banarasi Silk',
+        stock=8,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1610189020986-6f6f0baf45fd?auto=format&fit=crop&w=900&q=80'
+    ),
+    dict(
+        name='Threadwork Waistcoat Premium',
+        description='Detailed threadwork waistcoat for weddings and festive layering.',
+        price=3599,
+        original_price=4299,
+        category='clothing',
+        subcategory='Waistcoat',
+        brand='JUTTA LAGANI',
+        color='Maroon',
+        size='M,L,XL,XXL',
+        material='Jacquard',
+        stock=19,
+        is_available=True,
+        image='https://images.unsplash.com/photo-1487222477894-8943e31ef7b2?auto=format&fit=crop&w=900&q=80'
+    ),
+)
+
+
+# ============================================================
+# WTForms Classes
+# ============================================================
+
+class RegistrationForm(FlaskForm):
+    """User Registration Form"""
+    username = StringField('Username', validators=[
+        DataRequired(message='Username is required'),
+        Length(min=3, max=80, message='Username must be between 3 and 80 characters')
+    ])
+    email = StringField('Email', validators=[
+        DataRequired(message='Email is required'),
+        Email(message='Please enter a valid email address')
+    ])
+    full_name = StringField('Full Name', validators=[
+        Optional()
+    ])
+    phone = StringField('Phone Number', validators=[
+        Optional()
+    ])
+    password = PasswordField('Password', validators=[
+        DataRequired(message='Password is required'),
+        Length(min=6, message='Password must be at least 6 characters')
+    ])
+    confirm_password = PasswordField('Confirm Password', validators=[
+        DataRequired(message='Please confirm your password'),
+        EqualTo('password', message='Passwords must match')
+    ])
+
+class LoginForm(FlaskForm):
+    """User Login Form"""
+    email = StringField('Email', validators=[
+        DataRequired(message='Email is required'),
+        Email(message='Please enter a valid email address')
+    ])
+    password = PasswordField('Password', validators=[
+        DataRequired(message='Password is required')
+    ])
+    remember = BooleanField('Remember Me')
+
+class ProfileForm(FlaskForm):
+    """User Profile Update Form"""
+    username = StringField('Username', validators=[
+        DataRequired(),
+        Length(min=3, max=80)
+    ])
+    email = StringField('Email', validators=[
+        DataRequired(),
+        Email()
+    ])
+    full_name = StringField('Full Name', validators=[Optional()])
+    phone = StringField('Phone Number', validators=[Optional()])
+    address = TextAreaField('Address', validators=[Optional()])
+
+class ProductForm(FlaskForm):
+    """Product Management Form (Admin)"""
+    name = StringField('Product Name', validators=[
+        DataRequired(message='Product name is required'),
+        Length(max=200)
+    ])
+    description = TextAreaField('Description', validators=[
+        DataRequired(message='Description is required')
+    ])
+    price = FloatField('Price', validators=[
+        DataRequired(message='Price is required'),
+        NumberRange(min=0, message='Price must be positive')
+    ])
+    original_price = FloatField('Original Price (for discount)', validators=[
+        Optional(),
+        NumberRange(min=0)
+    ])
+    category = SelectField('Category', choices=CATEGORY_CHOICES,
+                           validators=[DataRequired()])
+    subcategory = StringField('Subcategory', validators=[Optional()])
+    brand = StringField('Brand', validators=[Optional()])
+    color = StringField('Color', validators=[Optional()])
+    size = StringField('Size', validators=[Optional()])
+    material = StringField('Material', validators=[Optional()])
+    stock = IntegerField('Stock Quantity', validators=[
+        DataRequired(),
+        NumberRange(min=0, message='Stock must be positive')
+    ])
+    is_available = BooleanField('Available for Sale', default=True)
+
+class CheckoutForm(FlaskForm):
+    """Checkout Form"""
+    shipping_name = StringField('Full Name', validators=[
+        DataRequired(message='Name is required')
+    ])
+    shipping_address = TextAreaField('Address', validators=[
+        DataRequired(message='Address is required')
+    ])
+    shipping_city = StringField('City', validators=[
+        DataRequired(message='City is required')
+    ])
+    shipping_phone = StringField('Phone Number', validators=[
+        DataRequired(message='Phone number is required')
+    ])
+    payment_method = SelectField('Payment Method', choices=PAYMENT_METHOD_CHOICES,
+                                 validators=[DataRequired()])
 
 
 # ============================================================
@@ -37,139 +852,59 @@ def create_app(config_class=Config):
     """
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.session_interface = Blake2SessionInterface()
     
     # Initialize extensions
     db.init_app(app)
+    cache.init_app(app)
+    compress.init_app(app)
+
+    # SQLite dev databases: WAL lets reads proceed during writes and
+    # synchronous=NORMAL drops the per-commit fsync (safe under WAL);
+    # cache_size=-64000 gives the page cache 64MB, temp sort/index
+    # scratch stays in memory, and mmap_size lets reads come straight
+    # from the OS page cache (256MB window)
+    if app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+        with app.app_context():
+            @event.listens_for(db.engine, 'connect')
+            def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+                cursor = dbapi_conn.cursor()
+                cursor.execute('PRAGMA journal_mode=WAL')
+                cursor.execute('PRAGMA synchronous=NORMAL')
+                cursor.execute('PRAGMA cache_size=-64000')
+                cursor.execute('PRAGMA temp_store=MEMORY')
+                cursor.execute('PRAGMA mmap_size=268435456')
+                cursor.close()
+
+    # Persist compiled templates across process restarts (gunicorn
+    # worker respawns re-parse every template otherwise)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
     
     # Setup Flask-Login
-    login_manager = LoginManager()
     login_manager.init_app(app)
-    login_manager.login_view = 'login'
-    login_manager.login_message = 'Please log in to access this page.'
-    login_manager.login_message_category = 'info'
-    
-    @login_manager.user_loader
-    def load_user(user_id):
-        """Load user by ID for Flask-Login"""
-        return User.query.get(int(user_id))
-    
-    # ============================================================
-    # WTForms Classes
-    # ============================================================
-    
-    class RegistrationForm(FlaskForm):
-        """User Registration Form"""
-        username = StringField('Username', validators=[
-            DataRequired(message='Username is required'),
-            Length(min=3, max=80, message='Username must be between 3 and 80 characters')
-        ])
-        email = StringField('Email', validators=[
-            DataRequired(message='Email is required'),
-            Email(message='Please enter a valid email address')
-        ])
-        full_name = StringField('Full Name', validators=[
-            Optional()
-        ])
-        phone = StringField('Phone Number', validators=[
-            Optional()
-        ])
-        password = PasswordField('Password', validators=[
-            DataRequired(message='Password is required'),
-            Length(min=6, message='Password must be at least 6 characters')
-        ])
-        confirm_password = PasswordField('Confirm Password', validators=[
-            DataRequired(message='Please confirm your password'),
-            EqualTo('password', message='Passwords must match')
-        ])
-    
-    class LoginForm(FlaskForm):
-        """User Login Form"""
-        email = StringField('Email', validators=[
-            DataRequired(message='Email is required'),
-            Email(message='Please enter a valid email address')
-        ])
-        password = PasswordField('Password', validators=[
-            DataRequired(message='Password is required')
-        ])
-        remember = BooleanField('Remember Me')
-    
-    class ProfileForm(FlaskForm):
-        """User Profile Update Form"""
-        username = StringField('Username', validators=[
-            DataRequired(),
-            Length(min=3, max=80)
-        ])
-        email = StringField('Email', validators=[
-            DataRequired(),
-            Email()
-        ])
-        full_name = StringField('Full Name', validators=[Optional()])
-        phone = StringField('Phone Number', validators=[Optional()])
-        address = TextAreaField('Address', validators=[Optional()])
-    
-    class ProductForm(FlaskForm):
-        """Product Management Form (Admin)"""
-        name = StringField('Product Name', validators=[
-            DataRequired(message='Product name is required'),
-            Length(max=200)
-        ])
-        description = TextAreaField('Description', validators=[
-            DataRequired(message='Description is required')
-        ])
-        price = FloatField('Price', validators=[
-            DataRequired(message='Price is required'),
-            NumberRange(min=0, message='Price must be positive')
-        ])
-        original_price = FloatField('Original Price (for discount)', validators=[
-            Optional(),
-            NumberRange(min=0)
-        ])
-        category = SelectField('Category', choices=[
-            ('shoes', 'Shoes'),
-            ('clothing', 'Clothing')
-        ], validators=[DataRequired()])
-        subcategory = StringField('Subcategory', validators=[Optional()])
-        brand = StringField('Brand', validators=[Optional()])
-        color = StringField('Color', validators=[Optional()])
-        size = StringField('Size', validators=[Optional()])
-        material = StringField('Material', validators=[Optional()])
-        stock = IntegerField('Stock Quantity', validators=[
-            DataRequired(),
-            NumberRange(min=0, message='Stock must be positive')
-        ])
-        is_available = BooleanField('Available for Sale', default=True)
-    
-    class CheckoutForm(FlaskForm):
-        """Checkout Form"""
-        shipping_name = StringField('Full Name', validators=[
-            DataRequired(message='Name is required')
-        ])
-        shipping_address = TextAreaField('Address', validators=[
-            DataRequired(message='Address is required')
-        ])
-        shipping_city = StringField('City', validators=[
-            DataRequired(message='City is required')
-        ])
-        shipping_phone = StringField('Phone Number', validators=[
-            DataRequired(message='Phone number is required')
-        ])
-        payment_method = SelectField('Payment Method', choices=[
-            ('cod', 'Cash on Delivery'),
-            ('card', 'Credit/Debit Card')
-        ], validators=[DataRequired()])
-    
+
     # ============================================================
     # TEMPLATE CONTEXT PROCESSORS
     # ============================================================
     
     @app.context_processor
     def inject_cart_count():
-        """Inject cart count into all templates"""
-        cart_count = 0
-        if current_user.is_authenticated:
-            cart_count = CartItem.query.filter_by(user_id=current_user.id).count()
-        elif 'cart' in session:
-            cart_count = len(session.get('cart', []))
+        """Inject cart count into all templates (at most one query per request)"""
+        cart_count = getattr(g, '_cart_count', None)
+        if cart_count is None:
+            cart_count = 0
+            if current_user.is_authenticated:
+                # Session-cached between cart writes: GET-heavy browsing
+                # renders the badge with zero queries
+                cart_count = session.get('cart_count')
+                if cart_count is None:
+                    cart_count = db.session.query(func.count(CartItem.id)).filter(
+                        CartItem.user_id == current_user.id
+                    ).scalar()
+                    session['cart_count'] = cart_count
+            elif 'cart' in session:
+                cart_count = len(session.get('cart', []))
+            g._cart_count = cart_count
         return dict(cart_count=cart_count)
     
     @app.context_processor
@@ -177,34 +912,127 @@ def create_app(config_class=Config):
         """Inject product categories into templates"""
         return dict(categories=['shoes', 'clothing'])
     
+    # Static image filenames, listed once at startup. Replaces a
+    # stat(2) syscall per product tile with a set lookup; new files only
+    # appear via deploys, which restart the process anyway.
+    _images_dir = os.path.join(app.static_folder, 'images')
+    _known_images = frozenset(
+        os.listdir(_images_dir) if os.path.isdir(_images_dir) else ()
+    )
+
+    # CSS/JS filenames aren't fingerprinted, so the 30-day browser cache
+    # would pin returning visitors to stale assets across deploys. Stamp
+    # their URLs with the newest asset mtime (computed once at boot) so
+    # a deploy that touches css/js changes the query string and busts
+    # the cache, while unchanged deploys keep it warm.
+    _asset_stamp = 0
+    for _sub in ('css', 'js'):
+        _dir = os.path.join(app.static_folder, _sub)
+        if os.path.isdir(_dir):
+            for _name in os.listdir(_dir):
+                _asset_stamp = max(
+                    _asset_stamp,
+                    int(os.path.getmtime(os.path.join(_dir, _name)))
+                )
+
+    @app.url_defaults
+    def _stamp_static_assets(endpoint, values):
+        if endpoint == 'static':
+            filename = values.get('filename', '')
+            if filename.endswith(('.css', '.js')):
+                values.setdefault('v', _asset_stamp)
+
+    def product_image_url(product):
+        """Return a safe image URL for a product with category fallback."""
+        image_name = getattr(product, 'image', None)
+        if image_name:
+            if str(image_name).startswith(_URL_PREFIXES):
+                return image_name
+            if image_name in _known_images:
+                return url_for('static', filename=f'images/{image_name}')
+        fallback = 'images/product-shoes.svg' if getattr(product, 'category', '') == 'shoes' else 'images/product-clothing.svg'
+        return url_for('static', filename=fallback)
+
     @app.context_processor
     def inject_template_helpers():
         """Expose helper utilities to templates."""
-        def product_image_url(product):
-            """Return a safe image URL for a product with category fallback."""
-            image_name = getattr(product, 'image', None)
-            if image_name:
-                if str(image_name).startswith(('http://', 'https://')):
-                    return image_name
-                local_path = os.path.join(app.static_folder, 'images', image_name)
-                if os.path.exists(local_path):
-                    return url_for('static', filename=f'images/{image_name}')
-            fallback = 'images/product-shoes.svg' if getattr(product, 'category', '') == 'shoes' else 'images/product-clothing.svg'
-            return url_for('static', filename=fallback)
-        
         return dict(product_image_url=product_image_url)
     
     # ============================================================
     # HELPER FUNCTIONS
     # ============================================================
     
+    def get_category_counts():
+        """Get available-product counts per category, cached briefly.
+
+        Counts only change on admin product writes, which invalidate
+        the cache explicitly via invalidate_product_caches().
+        """
+        counts = cache.get('category_counts')
+        if counts is None:
+            rows = dict(
+                db.session.query(Product.category, func.count(Product.id))
+                .filter_by(is_available=True)
+                .group_by(Product.category)
+                .all()
+            )
+            counts = {
+                'shoes': rows.get('shoes', 0),
+                'clothing': rows.get('clothing', 0)
+            }
+            cache.set('category_counts', counts)
+        return counts
+
+    def get_admin_product_count(category):
+        """Get the total product count for the admin listing, cached briefly.
+
+        Lets admin_products paginate with count=False so each page hit
+        skips the SELECT COUNT(*).
+        """
+        key = f'admin_product_count:{category or "all"}'
+        total = cache.get(key)
+        if total is None:
+            count_query = db.session.query(func.count(Product.id))
+            if category:
+                count_query = count_query.filter(Product.category == category)
+            total = count_query.scalar()
+            cache.set(key, total, timeout=60)
+        return total
+
+    def get_order_status_counts():
+        """Get order counts per status, cached briefly.
+
+        One GROUP BY serves the totals for both the unfiltered and the
+        per-status admin order listings.
+        """
+        counts = cache.get('order_status_counts')
+        if counts is None:
+            counts = dict(
+                db.session.query(Order.status, func.count(Order.id))
+                .group_by(Order.status)
+                .all()
+            )
+            cache.set('order_status_counts', counts, timeout=15)
+        return counts
+
+    def invalidate_product_caches():
+        """Drop cached product listings after a product write."""
+        cache.delete('category_counts')
+        cache.delete('avail_product_ids')
+        cache.delete_many('admin_product_count:all',
+                          'admin_product_count:shoes',
+                          'admin_product_count:clothing')
+        cache.delete('admin_dashboard_stats')
+
     def get_cart_items():
         """Get cart items for current user or session"""
         cart_items = []
-        
+
         if current_user.is_authenticated:
-            # Get cart from database
-            cart_db = CartItem.query.filter_by(user_id=current_user.id).all()
+            # Get cart from database (eager-load products to avoid N+1)
+            cart_db = CartItem.query.options(
+                joinedload(CartItem.product)
+            ).filter_by(user_id=current_user.id).all()
             for item in cart_db:
                 cart_items.append({
                     'id': item.id,
@@ -215,39 +1043,74 @@ def create_app(config_class=Config):
                     'total_price': item.total_price
                 })
         else:
-            # Get cart from session
-            cart_session = session.get('cart', [])
-            for item in cart_session:
-                product = Product.query.get(item['product_id'])
+            # Get cart from session (fetch all products in one query)
+            cart_session = get_session_cart()
+            product_ids = [item['product_id'] for item in cart_session.values()]
+            products_by_id = {}
+            if product_ids:
+                products_by_id = {
+                    p.id: p for p in Product.query.filter(Product.id.in_(product_ids)).all()
+                }
+            for item_id, item in cart_session.items():
+                product = products_by_id.get(item['product_id'])
                 if product:
                     cart_items.append({
-                        'id': item['id'],
+                        'id': int(item_id),
                         'product': product,
                         'quantity': item['quantity'],
                         'size': item.get('size'),
                         'color': item.get('color'),
                         'total_price': product.price * item['quantity']
                     })
-        
+
+        # Views that fetch the cart let inject_cart_count reuse the
+        # result instead of running its own COUNT, and the session copy
+        # self-heals here if an admin delete removed rows underneath it
+        g._cart_count = len(cart_items)
+        if current_user.is_authenticated:
+            session['cart_count'] = len(cart_items)
         return cart_items
     
     def get_cart_total():
-        """Calculate total price of cart"""
-        items = get_cart_items()
-        return sum(item['total_price'] for item in items)
+        """Calculate total price of cart (at most one query per request)"""
+        total = getattr(g, '_cart_total', None)
+        if total is None:
+            if current_user.is_authenticated:
+                # Aggregate in SQL instead of hydrating every cart row
+                total = db.session.query(
+                    func.coalesce(func.sum(Product.price * CartItem.quantity), 0)
+                ).select_from(CartItem).join(
+                    Product, CartItem.product_id == Product.id
+                ).filter(CartItem.user_id == current_user.id).scalar()
+            else:
+                # Session cart is already in memory; sum in Python
+                total = sum(item['total_price'] for item in get_cart_items())
+            g._cart_total = total
+        return total
     
-    def save_cart_to_session(cart_items):
-        """Save cart items to session"""
-        session['cart'] = [
-            {
-                'id': item['id'],
-                'product_id': item['product'].id,
-                'quantity': item['quantity'],
-                'size': item.get('size'),
-                'color': item.get('color')
-            }
-            for item in cart_items
-        ]
+    def get_session_cart():
+        """Return the session cart as a dict keyed by product id (string).
+
+        Keying on the product id gives O(1) add/update/remove with no
+        separate id counter. Legacy layouts (a plain list, or a dict
+        keyed by a running counter) are migrated in place, merging
+        duplicate products by summing quantities.
+        """
+        cart = session.get('cart', {})
+        if isinstance(cart, list):
+            cart = {str(index + 1): item for index, item in enumerate(cart)}
+        if any(key != str(item.get('product_id')) for key, item in cart.items()):
+            migrated = {}
+            for item in cart.values():
+                key = str(item.get('product_id'))
+                if key in migrated:
+                    migrated[key]['quantity'] += item.get('quantity', 1)
+                else:
+                    migrated[key] = item
+            cart = migrated
+            session['cart'] = cart
+            session.pop('cart_next_id', None)
+        return cart
     
     # ============================================================
     # ROUTES - HOME & GENERAL
@@ -258,20 +1121,35 @@ def create_app(config_class=Config):
         """
         Home Page - Displays featured products and hero section
         """
-        # Get featured products (random 5 products)
-        featured_products = Product.query.filter_by(is_available=True).order_by(
-            func.random()
-        ).limit(5).all()
-        
+        # Get featured products: sample 5 ids from a cached id list
+        # instead of sorting the whole table by random() every hit
+        available_ids = cache.get('avail_product_ids')
+        if available_ids is None:
+            available_ids = [
+                row[0] for row in
+                db.session.query(Product.id).filter_by(is_available=True).all()
+            ]
+            cache.set('avail_product_ids', available_ids)
+
+        featured_ids = random.sample(available_ids, min(5, len(available_ids)))
+        featured_products = []
+        if featured_ids:
+            featured_products = Product.query.options(
+                load_only(*PRODUCT_CARD_COLUMNS)
+            ).filter(Product.id.in_(featured_ids)).all()
+
         # Get new arrivals (latest 4 products)
-        new_arrivals = Product.query.filter_by(is_available=True).order_by(
+        new_arrivals = Product.query.options(
+            load_only(*PRODUCT_CARD_COLUMNS)
+        ).filter_by(is_available=True).order_by(
             Product.created_at.desc()
         ).limit(4).all()
         
         # Get categories with product counts
-        shoes_count = Product.query.filter_by(category='shoes', is_available=True).count()
-        clothing_count = Product.query.filter_by(category='clothing', is_available=True).count()
-        
+        category_counts = get_category_counts()
+        shoes_count = category_counts['shoes']
+        clothing_count = category_counts['clothing']
+
         return render_template('index.html',
                              featured_products=featured_products,
                              new_arrivals=new_arrivals,
@@ -310,10 +1188,12 @@ def create_app(config_class=Config):
         search = request.args.get('search', '')
         
         # Build query
-        query = Product.query.filter_by(is_available=True)
+        query = Product.query.options(
+            load_only(*PRODUCT_CARD_COLUMNS)
+        ).filter_by(is_available=True)
         
         # Filter by category
-        if category and category in ['shoes', 'clothing']:
+        if category and category in VALID_CATEGORIES:
             query = query.filter_by(category=category)
         
         # Search filter
@@ -324,23 +1204,25 @@ def create_app(config_class=Config):
                 (Product.brand.ilike(f'%{search}%'))
             )
         
-        # Sort products
+        # Sort products (id as tie-breaker keeps page boundaries stable
+        # when many rows share the same sort value)
         if sort_by == 'price_low':
-            query = query.order_by(Product.price.asc())
+            query = query.order_by(Product.price.asc(), Product.id.asc())
         elif sort_by == 'price_high':
-            query = query.order_by(Product.price.desc())
+            query = query.order_by(Product.price.desc(), Product.id.desc())
         elif sort_by == 'name':
-            query = query.order_by(Product.name.asc())
+            query = query.order_by(Product.name.asc(), Product.id.asc())
         else:  # newest
-            query = query.order_by(Product.created_at.desc())
+            query = query.order_by(Product.created_at.desc(), Product.id.desc())
         
         # Paginate
         products = query.paginate(page=page, per_page=per_page, error_out=False)
         
         # Get category counts
-        shoes_count = Product.query.filter_by(category='shoes', is_available=True).count()
-        clothing_count = Product.query.filter_by(category='clothing', is_available=True).count()
-        
+        category_counts = get_category_counts()
+        shoes_count = category_counts['shoes']
+        clothing_count = category_counts['clothing']
+
         return render_template('shop.html',
                              products=products,
                              current_category=category,
@@ -354,14 +1236,31 @@ def create_app(config_class=Config):
         """
         Product Detail Page - Displays single product details
         """
-        product = Product.query.get_or_404(product_id)
-        
-        # Get related products from same category
-        related_products = Product.query.filter(
-            Product.id != product_id,
-            Product.category == product.category,
-            Product.is_available == True
-        ).limit(4).all()
+        product = db.get_or_404(Product, product_id)
+
+        # Related products: cache the id list per product for 10 min.
+        # The fetch re-checks availability, so entries that went off
+        # sale drop out even while the cached list is stale.
+        cache_key = f'related:{product_id}'
+        related_ids = cache.get(cache_key)
+        if related_ids is None:
+            related_ids = [
+                row[0] for row in db.session.query(Product.id).filter(
+                    Product.id != product_id,
+                    Product.category == product.category,
+                    Product.is_available == True
+                ).limit(4).all()
+            ]
+            cache.set(cache_key, related_ids, timeout=600)
+
+        related_products = []
+        if related_ids:
+            related_products = Product.query.options(
+                load_only(*PRODUCT_CARD_COLUMNS)
+            ).filter(
+                Product.id.in_(related_ids),
+                Product.is_available == True
+            ).all()
         
         return render_template('product_detail.html',
                              product=product,
@@ -374,27 +1273,36 @@ def create_app(config_class=Config):
     @app.route('/wishlist')
     @login_required
     def wishlist():
-        wishlist_items = WishlistItem.query.filter_by(user_id=current_user.id).all()
+        wishlist_items = WishlistItem.query.options(
+            joinedload(WishlistItem.product)
+        ).filter_by(user_id=current_user.id).all()
         return render_template('wishlist.html', wishlist_items=wishlist_items)
     
     @app.route('/add_to_wishlist/<int:product_id>')
     @login_required
     def add_to_wishlist(product_id):
-        product = Product.query.get_or_404(product_id)
-        existing = WishlistItem.query.filter_by(user_id=current_user.id, product_id=product_id).first()
-        if existing:
-            flash(f'{product.name} is already in your wishlist!', 'info')
-        else:
-            wishlist_item = WishlistItem(user_id=current_user.id, product_id=product_id)
-            db.session.add(wishlist_item)
-            db.session.commit()
+        product = db.get_or_404(Product, product_id)
+
+        # Single INSERT ... ON CONFLICT DO NOTHING instead of a
+        # SELECT-then-INSERT pair; race-free under concurrent adds
+        dialect_insert = sqlite_insert if db.engine.dialect.name == 'sqlite' else pg_insert
+        stmt = dialect_insert(WishlistItem).values(
+            user_id=current_user.id,
+            product_id=product_id
+        ).on_conflict_do_nothing(index_elements=['user_id', 'product_id'])
+        result = db.session.execute(stmt)
+        db.session.commit()
+
+        if result.rowcount:
             flash(f'Added {product.name} to wishlist!', 'success')
+        else:
+            flash(f'{product.name} is already in your wishlist!', 'info')
         return redirect(url_for('wishlist'))
     
     @app.route('/remove_from_wishlist/<int:wishlist_id>')
     @login_required
     def remove_from_wishlist(wishlist_id):
-        wishlist_item = WishlistItem.query.get_or_404(wishlist_id)
+        wishlist_item = db.get_or_404(WishlistItem, wishlist_id)
         if wishlist_item.user_id == current_user.id:
             product_name = wishlist_item.product.name
             db.session.delete(wishlist_item)
@@ -440,7 +1348,7 @@ def create_app(config_class=Config):
             size = request.args.get('size')
             color = request.args.get('color')
         
-        product = Product.query.get_or_404(product_id)
+        product = db.get_or_404(Product, product_id)
         
         # Check stock
         if product.stock < quantity:
@@ -448,15 +1356,20 @@ def create_app(config_class=Config):
             return redirect(url_for('product_detail', product_id=product_id))
         
         if current_user.is_authenticated:
-            # Add to database cart
-            existing_item = CartItem.query.filter_by(
-                user_id=current_user.id,
-                product_id=product_id
-            ).first()
-            
-            if existing_item:
-                existing_item.quantity += quantity
+            # Add to database cart. A single guarded UPDATE bumps an
+            # existing row in place (no SELECT-then-UPDATE race, one
+            # round-trip); rowcount 0 means the product wasn't in the
+            # cart yet.
+            result = db.session.execute(
+                CartItem.__table__.update()
+                .where(CartItem.user_id == current_user.id)
+                .where(CartItem.product_id == product_id)
+                .values(quantity=CartItem.quantity + quantity)
+            )
+
+            if result.rowcount:
                 db.session.commit()
+                session.pop('cart_count', None)
                 flash(f'Updated {product.name} quantity in cart!', 'success')
             else:
                 cart_item = CartItem(
@@ -468,28 +1381,23 @@ def create_app(config_class=Config):
                 )
                 db.session.add(cart_item)
                 db.session.commit()
+                session.pop('cart_count', None)
                 flash(f'Added {product.name} to cart!', 'success')
         else:
-            # Add to session cart
-            cart = session.get('cart', [])
-            
-            # Check if product already in cart
-            found = False
-            for item in cart:
-                if item['product_id'] == product_id:
-                    item['quantity'] += quantity
-                    found = True
-                    break
-            
-            if not found:
-                cart.append({
-                    'id': len(cart) + 1,
+            # Add to session cart (keyed by product id: O(1) lookup)
+            cart = get_session_cart()
+            key = str(product_id)
+
+            if key in cart:
+                cart[key]['quantity'] += quantity
+            else:
+                cart[key] = {
                     'product_id': product_id,
                     'quantity': quantity,
                     'size': size,
                     'color': color
-                })
-            
+                }
+
             session['cart'] = cart
             flash(f'Added {product.name} to cart!', 'success')
         
@@ -501,23 +1409,23 @@ def create_app(config_class=Config):
         quantity = request.form.get('quantity', 1, type=int)
         
         if current_user.is_authenticated:
-            cart_item = CartItem.query.get_or_404(cart_item_id)
+            cart_item = db.get_or_404(CartItem, cart_item_id)
             if cart_item.user_id == current_user.id:
                 if quantity > 0:
                     cart_item.quantity = quantity
                 else:
                     db.session.delete(cart_item)
                 db.session.commit()
+                session.pop('cart_count', None)
                 flash('Cart updated!', 'success')
         else:
-            cart = session.get('cart', [])
-            for item in cart:
-                if item['id'] == cart_item_id:
-                    if quantity > 0:
-                        item['quantity'] = quantity
-                    else:
-                        cart.remove(item)
-                    break
+            cart = get_session_cart()
+            item = cart.get(str(cart_item_id))
+            if item:
+                if quantity > 0:
+                    item['quantity'] = quantity
+                else:
+                    cart.pop(str(cart_item_id))
             session['cart'] = cart
             flash('Cart updated!', 'success')
         
@@ -527,18 +1435,16 @@ def create_app(config_class=Config):
     def remove_from_cart(cart_item_id):
         """Remove item from cart"""
         if current_user.is_authenticated:
-            cart_item = CartItem.query.get_or_404(cart_item_id)
+            cart_item = db.get_or_404(CartItem, cart_item_id)
             if cart_item.user_id == current_user.id:
                 product_name = cart_item.product.name
                 db.session.delete(cart_item)
                 db.session.commit()
+                session.pop('cart_count', None)
                 flash(f'Removed {product_name} from cart!', 'success')
         else:
-            cart = session.get('cart', [])
-            for item in cart:
-                if item['id'] == cart_item_id:
-                    cart.remove(item)
-                    break
+            cart = get_session_cart()
+            cart.pop(str(cart_item_id), None)
             session['cart'] = cart
             flash('Item removed from cart!', 'success')
         
@@ -550,6 +1456,7 @@ def create_app(config_class=Config):
         if current_user.is_authenticated:
             CartItem.query.filter_by(user_id=current_user.id).delete()
             db.session.commit()
+            session.pop('cart_count', None)
         else:
             session.pop('cart', None)
         
@@ -599,29 +1506,53 @@ def create_app(config_class=Config):
             db.session.add(order)
             db.session.flush()  # Get order ID
             
-            # Create order items
+            # Create order items in a single multi-row INSERT
+            db.session.execute(insert(OrderItem), [
+                {
+                    'order_id': order.id,
+                    'product_id': item['product'].id,
+                    'quantity': item['quantity'],
+                    'unit_price': item['product'].price,
+                    'total_price': item['total_price'],
+                    'product_name': item['product'].name,
+                    'product_image': item['product'].image
+                }
+                for item in cart_items
+            ])
+
+            # Decrement stock with one guarded UPDATE per item. Not an
+            # executemany batch: psycopg2 only reports the last parameter
+            # set's rowcount after executemany (supports_sane_multi_rowcount
+            # is False), so an aggregate check would spuriously fail on
+            # multi-product checkouts in production. Per-statement rowcount
+            # is reliable on both backends, and the stock >= quantity guard
+            # prevents overselling under concurrent checkouts.
+            stock_update = (
+                Product.__table__.update()
+                .where(Product.id == bindparam('pid'))
+                .where(Product.stock >= bindparam('qty'))
+                .values(stock=Product.stock - bindparam('qty'))
+            )
             for item in cart_items:
-                order_item = OrderItem(
-                    order_id=order.id,
-                    product_id=item['product'].id,
-                    quantity=item['quantity'],
-                    unit_price=item['product'].price,
-                    total_price=item['total_price'],
-                    product_name=item['product'].name,
-                    product_image=item['product'].image
+                result = db.session.execute(
+                    stock_update,
+                    {'pid': item['product'].id, 'qty': item['quantity']}
                 )
-                db.session.add(order_item)
-                
-                # Update product stock
-                product = item['product']
-                product.stock -= item['quantity']
-            
-            db.session.commit()
-            
-            # Clear cart
-            CartItem.query.filter_by(user_id=current_user.id).delete()
+                if result.rowcount != 1:
+                    # Guard failed: another order took the stock
+                    db.session.rollback()
+                    flash('Sorry, an item in your cart no longer has enough stock!', 'warning')
+                    return redirect(url_for('cart'))
+
+            # Clear cart and commit order + items + stock in one transaction
+            CartItem.query.filter_by(user_id=current_user.id).delete(
+                synchronize_session=False
+            )
             db.session.commit()
-            
+            cache.delete('order_status_counts')
+            cache.delete('admin_dashboard_stats')
+            session.pop('cart_count', None)
+
             flash(f'Order placed successfully! Order number: {order.order_number}', 'success')
             return redirect(url_for('order_confirmation', order_id=order.id))
         
@@ -642,7 +1573,9 @@ def create_app(config_class=Config):
     @login_required
     def order_confirmation(order_id):
         """Order Confirmation Page"""
-        order = Order.query.get_or_404(order_id)
+        order = Order.query.options(
+            selectinload(Order.items)
+        ).get_or_404(order_id)
         
         if order.user_id != current_user.id and not current_user.is_admin:
             flash('Unauthorized access!', 'danger')
@@ -653,18 +1586,26 @@ def create_app(config_class=Config):
     @app.route('/my_orders')
     @login_required
     def my_orders():
-        """User's Order History"""
-        orders = Order.query.filter_by(user_id=current_user.id).order_by(
+        """User's Order History (paginated)"""
+        page = request.args.get('page', 1, type=int)
+
+        pagination = Order.query.options(
+            selectinload(Order.items)
+        ).filter_by(user_id=current_user.id).order_by(
             Order.created_at.desc()
-        ).all()
-        
-        return render_template('my_orders.html', orders=orders)
+        ).paginate(page=page, per_page=20, error_out=False)
+
+        return render_template('my_orders.html',
+                             orders=pagination.items,
+                             pagination=pagination)
     
     @app.route('/order/<int:order_id>')
     @login_required
     def order_detail(order_id):
         """Order Details Page"""
-        order = Order.query.get_or_404(order_id)
+        order = Order.query.options(
+            selectinload(Order.items)
+        ).get_or_404(order_id)
         
         if order.user_id != current_user.id and not current_user.is_admin:
             flash('Unauthorized access!', 'danger')
@@ -687,8 +1628,10 @@ def create_app(config_class=Config):
         
         if form.validate_on_submit():
             user = User.query.filter_by(email=form.email.data).first()
-            
-            if user and user.check_password(form.password.data) and user.is_admin:
+            password_ok = (user.check_password(form.password.data) if user
+                           else dummy_password_check(form.password.data))
+
+            if user and password_ok and user.is_admin:
                 login_user(user, remember=form.remember.data)
                 flash(f'Welcome to Admin Panel, {user.username}!', 'success')
                 return redirect(url_for('admin_dashboard'))
@@ -707,8 +1650,10 @@ def create_app(config_class=Config):
         
         if form.validate_on_submit():
             user = User.query.filter_by(email=form.email.data).first()
-            
-            if user and user.check_password(form.password.data):
+            password_ok = (user.check_password(form.password.data) if user
+                           else dummy_password_check(form.password.data))
+
+            if user and password_ok:
                 login_user(user, remember=form.remember.data)
                 
                 # Redirect to intended page or home
@@ -729,17 +1674,13 @@ def create_app(config_class=Config):
         form = RegistrationForm()
         
         if form.validate_on_submit():
-            # Check if email already exists
-            existing_user = User.query.filter(
-                (User.email == form.email.data) |
-                (User.username == form.username.data)
-            ).first()
-            
-            if existing_user:
-                if existing_user.email == form.email.data:
-                    flash('Email already registered!', 'danger')
-                else:
-                    flash('Username already taken!', 'danger')
+            # Check for duplicates with cheap id-only probes instead of
+            # hydrating a full User row (each hits a unique index)
+            if db.session.query(User.id).filter_by(email=form.email.data).scalar() is not None:
+                flash('Email already registered!', 'danger')
+                return redirect(url_for('register'))
+            if db.session.query(User.id).filter_by(username=form.username.data).scalar() is not None:
+                flash('Username already taken!', 'danger')
                 return redirect(url_for('register'))
             
             # Create new user
@@ -767,6 +1708,7 @@ def create_app(config_class=Config):
     def logout():
         """User Logout"""
         logout_user()
+        session.pop('cart_count', None)
         flash('You have been logged out!', 'info')
         return redirect(url_for('index'))
     
@@ -809,68 +1751,86 @@ def create_app(config_class=Config):
     # ============================================================
     
     @app.route('/admin')
-    @login_required
+    @admin_required
     def admin_dashboard():
         """Admin Dashboard"""
-        if not current_user.is_admin:
-            flash('Admin access required!', 'danger')
-            return redirect(url_for('index'))
-        
         # Check if user is master admin
         is_master = hasattr(current_user, 'is_master_admin') and current_user.is_master_admin
-        
-        # Statistics
-        total_products = Product.query.count()
-        total_orders = Order.query.count()
-        total_users = User.query.count()
-        total_revenue = db.session.query(func.sum(Order.total_amount)).scalar() or 0
-        
-        # Recent orders
-        recent_orders = Order.query.order_by(Order.created_at.desc()).limit(10).all()
-        
-        # Low stock products
-        low_stock = Product.query.filter(Product.stock < 10).limit(5).all()
-        
+
+        # Statistics (cached briefly; four aggregate scans otherwise run
+        # on every dashboard hit)
+        stats = cache.get('admin_dashboard_stats')
+        if stats is None:
+            # All four aggregates as scalar subqueries of one statement:
+            # a single round-trip instead of four
+            row = db.session.execute(select(
+                select(func.count(Product.id)).scalar_subquery().label('total_products'),
+                select(func.count(Order.id)).scalar_subquery().label('total_orders'),
+                select(func.count(User.id)).scalar_subquery().label('total_users'),
+                select(func.coalesce(func.sum(Order.total_amount), 0))
+                .scalar_subquery().label('total_revenue'),
+            )).one()
+            stats = {
+                'total_products': row.total_products,
+                'total_orders': row.total_orders,
+                'total_users': row.total_users,
+                'total_revenue': row.total_revenue,
+            }
+            cache.set('admin_dashboard_stats', stats, timeout=30)
+
+        # Recent orders (customer name is shown per row)
+        recent_orders = Order.query.options(
+            joinedload(Order.user)
+        ).order_by(Order.created_at.desc()).limit(10).all()
+        
+        # Low stock products (only the columns the table renders)
+        low_stock = Product.query.options(
+            load_only(Product.name, Product.category, Product.price, Product.stock)
+        ).filter(Product.stock < 10).limit(5).all()
+
         return render_template('admin_dashboard.html',
-                             total_products=total_products,
-                             total_orders=total_orders,
-                             total_users=total_users,
-                             total_revenue=total_revenue,
+                             total_products=stats['total_products'],
+                             total_orders=stats['total_orders'],
+                             total_users=stats['total_users'],
+                             total_revenue=stats['total_revenue'],
                              recent_orders=recent_orders,
                              low_stock=low_stock)
     
     @app.route('/admin/products')
     @app.route('/admin/products/<category>')
-    @login_required
+    @admin_required
     def admin_products(category=None):
         """Admin Product Management"""
-        if not current_user.is_admin:
-            flash('Admin access required!', 'danger')
-            return redirect(url_for('index'))
-        
         page = request.args.get('page', 1, type=int)
         per_page = 20
         
-        query = Product.query
-        if category and category in ['shoes', 'clothing']:
+        # The grid renders a handful of columns; skip shipping the long
+        # description/meta text fields for every row
+        query = Product.query.options(load_only(
+            Product.name, Product.brand, Product.category, Product.price,
+            Product.original_price, Product.stock, Product.is_available,
+            Product.image, Product.updated_at
+        ))
+        if category and category in VALID_CATEGORIES:
             query = query.filter_by(category=category)
         
-        products = query.order_by(Product.created_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
+        # count=False skips the per-hit SELECT COUNT(*); the total comes
+        # from a short-lived cache invalidated on product writes
+        products = query.order_by(
+            Product.created_at.desc(), Product.id.desc()
+        ).paginate(
+            page=page, per_page=per_page, error_out=False, count=False
         )
-        
+        products.total = get_admin_product_count(category)
+
         return render_template('admin_products.html',
                              products=products,
                              current_category=category)
     
     @app.route('/admin/product/add', methods=['GET', 'POST'])
-    @login_required
+    @admin_required
     def admin_product_add():
         """Add New Product (Admin)"""
-        if not current_user.is_admin:
-            flash('Admin access required!', 'danger')
-            return redirect(url_for('index'))
-        
         form = ProductForm()
         if request.method == 'GET':
             form.is_available.data = True
@@ -894,21 +1854,20 @@ def create_app(config_class=Config):
             
             db.session.add(product)
             db.session.commit()
-            
-            flash(f'Product "{product.name}" added successfully!', 'success')
+            invalidate_product_caches()
+
+            # Flash the form value: touching product.name here would
+            # re-SELECT the row (attributes expire on commit)
+            flash(f'Product "{form.name.data}" added successfully!', 'success')
             return redirect(url_for('admin_products'))
         
         return render_template('admin_product_add.html', form=form, product=None)
     
     @app.route('/admin/product/edit/<int:product_id>', methods=['GET', 'POST'])
-    @login_required
+    @admin_required
     def admin_product_edit(product_id):
         """Edit Product (Admin)"""
-        if not current_user.is_admin:
-            flash('Admin access required!', 'danger')
-            return redirect(url_for('index'))
-        
-        product = Product.query.get_or_404(product_id)
+        product = db.get_or_404(Product, product_id)
         form = ProductForm(obj=product)
         
         if form.validate_on_submit():
@@ -926,81 +1885,98 @@ def create_app(config_class=Config):
             product.is_available = form.is_available.data
             
             db.session.commit()
-            
-            flash(f'Product "{product.name}" updated successfully!', 'success')
+            invalidate_product_caches()
+
+            flash(f'Product "{form.name.data}" updated successfully!', 'success')
             return redirect(url_for('admin_products'))
         
         return render_template('admin_product_add.html', form=form, product=product)
     
     @app.route('/admin/product/delete/<int:product_id>')
-    @login_required
+    @admin_required
     def admin_product_delete(product_id):
         """Delete Product (Admin)"""
-        if not current_user.is_admin:
-            flash('Admin access required!', 'danger')
-            return redirect(url_for('index'))
-        
-        product = Product.query.get_or_404(product_id)
-        product_name = product.name
-        
-        # Delete related cart items first
-        CartItem.query.filter_by(product_id=product_id).delete()
-        
-        db.session.delete(product)
+        # Only the name is needed for the flash; skip loading the row
+        product_name = db.session.query(Product.name).filter_by(id=product_id).scalar()
+        if product_name is None:
+            abort(404)
+
+        # Core bulk deletes: one DELETE per table, no ORM cascade
+        # bookkeeping (which would load children just to null them out)
+        db.session.execute(delete(CartItem).where(CartItem.product_id == product_id))
+        db.session.execute(delete(WishlistItem).where(WishlistItem.product_id == product_id))
+        db.session.execute(delete(Product).where(Product.id == product_id))
         db.session.commit()
-        
+        invalidate_product_caches()
+
         flash(f'Product "{product_name}" deleted successfully!', 'success')
         return redirect(url_for('admin_products'))
     
     @app.route('/admin/orders')
-    @login_required
+    @admin_required
     def admin_orders():
         """Admin Order Management"""
-        if not current_user.is_admin:
-            flash('Admin access required!', 'danger')
-            return redirect(url_for('index'))
-        
         page = request.args.get('page', 1, type=int)
         per_page = 20
         
         status_filter = request.args.get('status')
         
-        query = Order.query
+        # The list shows the customer name per row; join it up front
+        query = Order.query.options(joinedload(Order.user))
         if status_filter:
             query = query.filter_by(status=status_filter)
-        
-        orders = query.order_by(Order.created_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
+
+        # count=False: the total comes from one cached GROUP BY instead
+        # of a COUNT(*) per page hit
+        orders = query.order_by(
+            Order.created_at.desc(), Order.id.desc()
+        ).paginate(
+            page=page, per_page=per_page, error_out=False, count=False
         )
-        
+        status_counts = get_order_status_counts()
+        if status_filter:
+            orders.total = status_counts.get(status_filter, 0)
+        else:
+            orders.total = sum(status_counts.values())
+
         return render_template('admin_orders.html', orders=orders, status_filter=status_filter)
     
     @app.route('/admin/order/<int:order_id>')
-    @login_required
+    @admin_required
     def admin_order_detail(order_id):
         """Admin Order Detail"""
-        if not current_user.is_admin:
-            flash('Admin access required!', 'danger')
-            return redirect(url_for('index'))
-        
-        order = Order.query.get_or_404(order_id)
-        
+        # Items and the customer row are both rendered; eager-load them
+        # so the view runs three statements instead of 1+N
+        order = Order.query.options(
+            selectinload(Order.items),
+            joinedload(Order.user)
+        ).get_or_404(order_id)
+
         return render_template('admin_order_detail.html', order=order)
     
     @app.route('/admin/order/update_status/<int:order_id>', methods=['POST'])
-    @login_required
+    @admin_required
     def admin_update_order_status(order_id):
         """Update Order Status (Admin)"""
-        if not current_user.is_admin:
-            flash('Admin access required!', 'danger')
-            return redirect(url_for('index'))
-        
-        order = Order.query.get_or_404(order_id)
         new_status = request.form.get('status')
-        
-        order.status = new_status
+
+        if new_status not in VALID_ORDER_STATUSES:
+            flash('Invalid order status!', 'danger')
+            return redirect(url_for('admin_order_detail', order_id=order_id))
+
+        # Write-only path: one UPDATE instead of loading the row first;
+        # rowcount doubles as the existence check
+        result = db.session.execute(
+            Order.__table__.update()
+            .where(Order.id == order_id)
+            .values(status=new_status)
+        )
+        if result.rowcount == 0:
+            db.session.rollback()
+            abort(404)
         db.session.commit()
-        
+        cache.delete('order_status_counts')
+
         flash(f'Order status updated to "{new_status}"', 'success')
         return redirect(url_for('admin_order_detail', order_id=order_id))
     
@@ -1026,693 +2002,169 @@ def create_app(config_class=Config):
     # ============================================================
     
     def _build_sample_products():
-        """Build the default sample products list."""
-        return [
-            Product(
-                name='Traditional Mojari',
-                description='Handcrafted leather mojaris with traditional embroidery. Perfect for weddings and festive occasions.',
-                price=2499,
-                original_price=2999,
-                category='shoes',
-                subcategory='Mojari',
-                brand='JUTTA LAGANI',
-                color='Maroon',
-                size='6,7,8,9,10',
-                material='Genuine Leather',
-                stock=50,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1542291026-7eec264c27ff?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Urban Jutti',
-                description='Modern fusion juttis with contemporary design. Comfortable for daily wear.',
-                price=1899,
-                original_price=2299,
-                category='shoes',
-                subcategory='Jutti',
-                brand='JUTTA LAGANI',
-                color='Gold',
-                size='6,7,8,9,10,11',
-                material='Synthetic Leather',
-                stock=35,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1514996937319-344454492b37?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Kolhapuri Chappal',
-                description='Traditional Kolhapuri chappals handcrafted by skilled artisans. Durable and stylish.',
-                price=1599,
-                category='shoes',
-                subcategory='Kolhapuri',
-                brand='JUTTA LAGANI',
-                color='Brown',
-                size='7,8,9,10,11',
-                material='Leather',
-                stock=40,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1460353581641-37baddab0fa2?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Loafers Party Wear',
-                description='Elegant loafers for party wear. Features embroidered traditional motifs.',
-                price=3299,
-                original_price=3999,
-                category='shoes',
-                subcategory='Loafers',
-                brand='JUTTA LAGANI',
-                color='Black',
-                size='7,8,9,10,11',
-                material='Premium Leather',
-                stock=25,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1491553895911-0055eca6402d?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Sports Sneakers',
-                description='Comfortable sneakers with ethnic prints. Perfect for casual outings.',
-                price=2199,
-                category='shoes',
-                subcategory='Sneakers',
-                brand='JUTTA LAGANI',
-                color='Multi',
-                size='6,7,8,9,10',
-                material='Canvas',
-                stock=60,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1525966222134-fcfa99b8ae77?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Royal Velvet Jutti',
-                description='Premium velvet jutti with detailed zari embroidery for festive wear.',
-                price=2799,
-                original_price=3399,
-                category='shoes',
-                subcategory='Jutti',
-                brand='JUTTA LAGANI',
-                color='Navy',
-                size='6,7,8,9,10',
-                material='Velvet',
-                stock=28,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1528701800489-20be9c5f6f3a?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Classic Ethnic Loafers',
-                description='Slip-on loafers with handcrafted finish, suitable for formal occasions.',
-                price=3599,
-                original_price=4299,
-                category='shoes',
-                subcategory='Loafers',
-                brand='JUTTA LAGANI',
-                color='Tan',
-                size='7,8,9,10,11',
-                material='Genuine Leather',
-                stock=22,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1549298916-b41d501d3772?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Festive Kolhapuri Premium',
-                description='Traditional Kolhapuri with cushioned sole and artisan-crafted straps.',
-                price=2399,
-                category='shoes',
-                subcategory='Kolhapuri',
-                brand='JUTTA LAGANI',
-                color='Brown',
-                size='6,7,8,9,10',
-                material='Leather',
-                stock=34,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1494496195158-c3becb4f2475?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Handwoven Bridal Mojari',
-                description='Wedding-ready mojari with handwoven detailing and cushioned insole for comfort.',
-                price=3899,
-                original_price=4599,
-                category='shoes',
-                subcategory='Mojari',
-                brand='JUTTA LAGANI',
-                color='Ivory',
-                size='6,7,8,9,10',
-                material='Leather',
-                stock=18,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1573100925118-870b8efc799d?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Embroidered Slip-On Jutti',
-                description='Elegant slip-on jutti with floral embroidery, ideal for festive occasions.',
-                price=2599,
-                original_price=3099,
-                category='shoes',
-                subcategory='Jutti',
-                brand='JUTTA LAGANI',
-                color='Wine',
-                size='6,7,8,9,10',
-                material='Textile',
-                stock=30,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1600185365483-26d7a4cc7519?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Heritage Peshawari Sandal',
-                description='Traditional peshawari sandal with reinforced sole and artisan finish.',
-                price=2999,
-                original_price=3599,
-                category='shoes',
-                subcategory='Sandal',
-                brand='JUTTA LAGANI',
-                color='Brown',
-                size='7,8,9,10,11',
-                material='Genuine Leather',
-                stock=26,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1531312267126-822c7d45d6a4?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Desert Craft Loafers',
-                description='Hand-finished loafers with stitched detailing and soft padded sole.',
-                price=3499,
-                original_price=4099,
-                category='shoes',
-                subcategory='Loafers',
-                brand='JUTTA LAGANI',
-                color='Camel',
-                size='7,8,9,10,11',
-                material='Leather',
-                stock=24,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1560769629-975ec94e6a86?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Regal Wedding Mojari',
-                description='Premium wedding mojari with antique zari and comfort insole.',
-                price=4299,
-                original_price=5099,
-                category='shoes',
-                subcategory='Mojari',
-                brand='JUTTA LAGANI',
-                color='Gold',
-                size='6,7,8,9,10',
-                material='Leather',
-                stock=16,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1608256246200-53e635b5b65f?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Heritage Thread Jutti',
-                description='Thread-embroidered jutti inspired by classic North Indian motifs.',
-                price=2699,
-                original_price=3199,
-                category='shoes',
-                subcategory='Jutti',
-                brand='JUTTA LAGANI',
-                color='Rust',
-                size='6,7,8,9,10',
-                material='Textile',
-                stock=29,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1543163521-1bf539c55dd2?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Urban Ethnic Slip-On',
-                description='Everyday slip-on with ethnic pattern band and lightweight feel.',
-                price=2199,
-                original_price=2699,
-                category='shoes',
-                subcategory='Slip-On',
-                brand='JUTTA LAGANI',
-                color='Grey',
-                size='7,8,9,10',
-                material='Canvas',
-                stock=38,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1465453869711-7e174808ace9?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Comfort Fusion Sneakers',
-                description='Fusion sneakers with breathable upper and extra arch support.',
-                price=3199,
-                original_price=3899,
-                category='shoes',
-                subcategory='Sneakers',
-                brand='JUTTA LAGANI',
-                color='White',
-                size='6,7,8,9,10,11',
-                material='Mesh',
-                stock=42,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1542291026-7eec264c27ff?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Artisan Leather Mule',
-                description='Backless leather mule with hand-burnished finish for quick wear.',
-                price=2899,
-                original_price=3399,
-                category='shoes',
-                subcategory='Mule',
-                brand='JUTTA LAGANI',
-                color='Tan',
-                size='7,8,9,10',
-                material='Leather',
-                stock=21,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1582588678413-dbf45f4823e9?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Midnight Party Loafers',
-                description='Gloss-finish party loafers with elegant silhouette for evening events.',
-                price=3899,
-                original_price=4599,
-                category='shoes',
-                subcategory='Loafers',
-                brand='JUTTA LAGANI',
-                color='Black',
-                size='7,8,9,10,11',
-                material='Patent Leather',
-                stock=19,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1614252369475-531eba835eb1?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Classic Brown Brogues',
-                description='Traditional brogue detailing blended with modern comfort.',
-                price=3599,
-                original_price=4299,
-                category='shoes',
-                subcategory='Brogues',
-                brand='JUTTA LAGANI',
-                color='Brown',
-                size='7,8,9,10,11',
-                material='Leather',
-                stock=27,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1614252235316-8c857d38b5f4?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Gold Festive Khussa',
-                description='Festive khussa with metallic detailing for traditional occasions.',
-                price=3099,
-                original_price=3699,
-                category='shoes',
-                subcategory='Khussa',
-                brand='JUTTA LAGANI',
-                color='Gold',
-                size='6,7,8,9,10',
-                material='Synthetic Leather',
-                stock=23,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1525966222134-fcfa99b8ae77?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Printed Canvas Jutti',
-                description='Colorful printed jutti for everyday ethnic-casual styling.',
-                price=1999,
-                original_price=2499,
-                category='shoes',
-                subcategory='Jutti',
-                brand='JUTTA LAGANI',
-                color='Multi',
-                size='6,7,8,9,10',
-                material='Canvas',
-                stock=44,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1463100099107-aa0980c362e6?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Kurta Set - Festive',
-                description='Beautiful kurta set with dupatta. Perfect for festive occasions.',
-                price=3499,
-                original_price=4299,
-                category='clothing',
-                subcategory='Kurta Set',
-                brand='JUTTA LAGANI',
-                color='Maroon',
-                size='S,M,L,XL,XXL',
-                material='Silk Blend',
-                stock=30,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1521572163474-6864f9cf17ab?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Indo-Western Sherwani',
-                description='Modern sherwani with traditional touch. Ideal for groom wear.',
-                price=8999,
-                original_price=10999,
-                category='clothing',
-                subcategory='Sherwani',
-                brand='JUTTA LAGANI',
-                color='Cream',
-                size='S,M,L,XL,XXL',
-                material='Silk',
-                stock=15,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1593030761757-71fae45fa0e7?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Palazzo Suit',
-                description='Elegant palazzo suit with printed design. Comfortable and stylish.',
-                price=2799,
-                category='clothing',
-                subcategory='Palazzo',
-                brand='JUTTA LAGANI',
-                color='Blue',
-                size='S,M,L,XL',
-                material='Cotton',
-                stock=45,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1483985988355-763728e1935b?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Anarkali Dress',
-                description='Royal anarkali dress with heavy work. Perfect for celebrations.',
-                price=4599,
-                original_price=5499,
-                category='clothing',
-                subcategory='Anarkali',
-                brand='JUTTA LAGANI',
-                color='Red',
-                size='S,M,L,XL',
-                material='Georgette',
-                stock=20,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1496747611176-843222e1e57c?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Lehenga Choli',
-                description='Traditional lehenga with embroidered blouse. Bridal collection.',
-                price=6999,
-                original_price=8999,
-                category='clothing',
-                subcategory='Lehenga',
-                brand='JUTTA LAGANI',
-                color='Pink',
-                size='S,M,L,XL',
-                material='Silk',
-                stock=10,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1529139574466-a303027c1d8b?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Printed Cotton Kurti',
-                description='Daily-wear cotton kurti with breathable fabric and minimal prints.',
-                price=1899,
-                original_price=2299,
-                category='clothing',
-                subcategory='Kurti',
-                brand='JUTTA LAGANI',
-                color='Mustard',
-                size='S,M,L,XL',
-                material='Cotton',
-                stock=52,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1434389677669-e08b4cac3105?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Embroidered Waistcoat Set',
-                description='Festive waistcoat set with subtle embroidery for weddings and parties.',
-                price=4299,
-                original_price=4999,
-                category='clothing',
-                subcategory='Waistcoat',
-                brand='JUTTA LAGANI',
-                color='Olive',
-                size='M,L,XL,XXL',
-                material='Silk Blend',
-                stock=18,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1445205170230-053b83016050?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Contemporary Pathani Suit',
-                description='Modern pathani suit with comfort fit and premium texture.',
-                price=5199,
-                original_price=6099,
-                category='clothing',
-                subcategory='Pathani',
-                brand='JUTTA LAGANI',
-                color='Charcoal',
-                size='M,L,XL,XXL',
-                material='Rayon Blend',
-                stock=20,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1469334031218-e382a71b716b?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Silk Festive Kurta',
-                description='Premium silk kurta with subtle patterns for festive gatherings.',
-                price=3799,
-                original_price=4499,
-                category='clothing',
-                subcategory='Kurta',
-                brand='JUTTA LAGANI',
-                color='Royal Blue',
-                size='M,L,XL,XXL',
-                material='Silk',
-                stock=24,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1489987707025-afc232f7ea0f?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Linen Nehru Jacket',
-                description='Lightweight linen Nehru jacket that pairs well with kurtas and shirts.',
-                price=2899,
-                original_price=3499,
-                category='clothing',
-                subcategory='Jacket',
-                brand='JUTTA LAGANI',
-                color='Beige',
-                size='M,L,XL',
-                material='Linen',
-                stock=32,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1591047139829-d91aecb6caea?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Embroidered Anarkali Gown',
-                description='Floor-length embroidered anarkali gown for weddings and celebrations.',
-                price=6299,
-                original_price=7599,
-                category='clothing',
-                subcategory='Anarkali',
-                brand='JUTTA LAGANI',
-                color='Emerald',
-                size='S,M,L,XL',
-                material='Georgette',
-                stock=14,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1464863979621-258859e62245?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Handblock Printed Kurta',
-                description='Soft handblock-printed kurta designed for all-day comfort.',
-                price=2499,
-                original_price=2999,
-                category='clothing',
-                subcategory='Kurta',
-                brand='JUTTA LAGANI',
-                color='Indigo',
-                size='S,M,L,XL',
-                material='Cotton',
-                stock=36,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1503342217505-b0a15ec3261c?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Festive Chikankari Kurta',
-                description='Elegant chikankari kurta crafted for celebrations and family events.',
-                price=3299,
-                original_price=3899,
-                category='clothing',
-                subcategory='Kurta',
-                brand='JUTTA LAGANI',
-                color='Off White',
-                size='M,L,XL,XXL',
-                material='Cotton Silk',
-                stock=22,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1524504388940-b1c1722653e1?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Velvet Sherwani Set',
-                description='Royal velvet sherwani set with premium buttons and contrast stole.',
-                price=10999,
-                original_price=12999,
-                category='clothing',
-                subcategory='Sherwani',
-                brand='JUTTA LAGANI',
-                color='Burgundy',
-                size='M,L,XL,XXL',
-                material='Velvet',
-                stock=12,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1592878849122-5c3ad22e1a6b?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Casual Cotton Pathani',
-                description='Relaxed-fit cotton pathani with clean lines and breathable fabric.',
-                price=2999,
-                original_price=3599,
-                category='clothing',
-                subcategory='Pathani',
-                brand='JUTTA LAGANI',
-                color='Slate',
-                size='M,L,XL',
-                material='Cotton',
-                stock=28,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1475180098004-ca77a66827be?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Zari Border Saree',
-                description='Classic saree with shimmering zari border for festive elegance.',
-                price=5599,
-                original_price=6699,
-                category='clothing',
-                subcategory='Saree',
-                brand='JUTTA LAGANI',
-                color='Magenta',
-                size='Free Size',
-                material='Silk Blend',
-                stock=17,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1610030469983-98e550d6193c?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Embroidered Palazzo Set Plus',
-                description='Premium embroidered palazzo set with matching dupatta.',
-                price=4999,
-                original_price=5899,
-                category='clothing',
-                subcategory='Palazzo',
-                brand='JUTTA LAGANI',
-                color='Teal',
-                size='S,M,L,XL',
-                material='Georgette',
-                stock=20,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1487412947147-5cebf100ffc2?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Asymmetric Indo Jacket',
-                description='Asymmetric Indo-western jacket for modern ceremonial looks.',
-                price=4699,
-                original_price=5599,
-                category='clothing',
-                subcategory='Jacket',
-                brand='JUTTA LAGANI',
-                color='Navy',
-                size='M,L,XL',
-                material='Silk Blend',
-                stock=15,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1617137968427-85924c800a22?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Pastel Kurta Pajama',
-                description='Pastel kurta pajama set designed for daytime functions and comfort.',
-                price=3199,
-                original_price=3899,
-                category='clothing',
-                subcategory='Kurta Set',
-                brand='JUTTA LAGANI',
-                color='Mint',
-                size='S,M,L,XL',
-                material='Cotton Linen',
-                stock=30,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1509631179647-0177331693ae?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Royal Banarasi Lehenga',
-                description='Luxury banarasi lehenga set with rich weaving and festive shine.',
-                price=12999,
-                original_price=15499,
-                category='clothing',
-                subcategory='Lehenga',
-                brand='JUTTA LAGANI',
-                color='Royal Red',
-                size='S,M,L,XL',
-                material='Banarasi Silk',
-                stock=8,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1610189020986-6f6f0baf45fd?auto=format&fit=crop&w=900&q=80'
-            ),
-            Product(
-                name='Threadwork Waistcoat Premium',
-                description='Detailed threadwork waistcoat for weddings and festive layering.',
-                price=3599,
-                original_price=4299,
-                category='clothing',
-                subcategory='Waistcoat',
-                brand='JUTTA LAGANI',
-                color='Maroon',
-                size='M,L,XL,XXL',
-                material='Jacquard',
-                stock=19,
-                is_available=True,
-                image='https://images.unsplash.com/photo-1487222477894-8943e31ef7b2?auto=format&fit=crop&w=900&q=80'
-            ),
-        ]
-    
+        """Return fresh copies of the module-level sample catalog."""
+        return [dict(sample) for sample in SAMPLE_PRODUCTS]
+
+    def ensure_schema_indexes():
+        """Create metadata-declared indexes missing from existing tables.
+
+        db.create_all() only creates missing tables — constraints and
+        indexes added to a model after its table already exists never
+        materialize on a deployed database. Ensure them here with
+        CREATE INDEX IF NOT EXISTS, which both SQLite and PostgreSQL
+        support.
+        """
+        # The wishlist ON CONFLICT insert requires a real unique
+        # index/constraint on (user_id, product_id); databases created
+        # before uq_wishlist_user_product only have the plain table.
+        # Collapse any duplicate rows that predate the constraint, then
+        # add the index. Fresh databases already have the constraint
+        # from create_all, so skip to avoid a redundant second index.
+        inspector = inspect(db.engine)
+        wishlist_cols = ['user_id', 'product_id']
+        has_unique = any(
+            uc['column_names'] == wishlist_cols
+            for uc in inspector.get_unique_constraints('wishlist_items')
+        ) or any(
+            ix.get('unique') and ix['column_names'] == wishlist_cols
+            for ix in inspector.get_indexes('wishlist_items')
+        )
+        if not has_unique:
+            db.session.execute(text(
+                'DELETE FROM wishlist_items WHERE id NOT IN ('
+                'SELECT MIN(id) FROM wishlist_items '
+                'GROUP BY user_id, product_id)'
+            ))
+            db.session.execute(text(
+                'CREATE UNIQUE INDEX IF NOT EXISTS uq_wishlist_user_product '
+                'ON wishlist_items (user_id, product_id)'
+            ))
+
+        # Listing/pagination indexes declared in __table_args__ and the
+        # cart_items.user_id lookup index; IF NOT EXISTS makes this a
+        # no-op on fresh databases where create_all built them already
+        for ddl in (
+            'CREATE INDEX IF NOT EXISTS ix_products_category_created '
+            'ON products (category, created_at)',
+            'CREATE INDEX IF NOT EXISTS ix_products_avail_cat_created '
+            'ON products (is_available, category, created_at)',
+            'CREATE INDEX IF NOT EXISTS ix_products_avail_cat_price '
+            'ON products (is_available, category, price)',
+            'CREATE INDEX IF NOT EXISTS ix_products_created_id '
+            'ON products (created_at, id)',
+            'CREATE INDEX IF NOT EXISTS ix_orders_user_created '
+            'ON orders (user_id, created_at)',
+            'CREATE INDEX IF NOT EXISTS ix_orders_created_id '
+            'ON orders (created_at, id)',
+            'CREATE INDEX IF NOT EXISTS ix_cart_items_user_id '
+            'ON cart_items (user_id)',
+        ):
+            db.session.execute(text(ddl))
+        db.session.commit()
+
+    def ensure_search_indexes():
+        """Create trigram indexes for the shop search (PostgreSQL only).
+
+        The %term% ILIKE filters on name/description/brand cannot use
+        B-tree indexes; pg_trgm GIN indexes serve them directly. SQLite
+        (local dev) has no equivalent, so this is a no-op there.
+        """
+        if db.engine.dialect.name != 'postgresql':
+            return
+        db.session.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+        for column in ('name', 'description', 'brand'):
+            db.session.execute(text(
+                f'CREATE INDEX IF NOT EXISTS ix_products_{column}_trgm '
+                f'ON products USING gin ({column} gin_trgm_ops)'
+            ))
+        db.session.commit()
+
     def seed_sample_products():
         """
         Insert sample products if missing and upgrade invalid legacy image refs.
         Uses product name uniqueness to keep the operation idempotent.
         """
         sample_products = _build_sample_products()
-        sample_by_name = {product.name: product for product in sample_products}
-        sample_names = list(sample_by_name.keys())
-        
-        existing_products = Product.query.filter(Product.name.in_(sample_names)).all()
-        existing_by_name = {product.name: product for product in existing_products}
-        
+        sample_names = [sample['name'] for sample in sample_products]
+
+        # Narrow tuple rows: name-keyed existence plus the image check
+        # need three columns, not full ORM objects
+        existing_by_name = {
+            row.name: row for row in db.session.execute(
+                select(Product.id, Product.name, Product.image)
+                .where(Product.name.in_(sample_names))
+            )
+        }
+
         products_to_add = []
-        images_updated = 0
-        
+        image_updates = []
+
         for sample in sample_products:
-            existing = existing_by_name.get(sample.name)
+            existing = existing_by_name.get(sample['name'])
             if not existing:
                 products_to_add.append(sample)
                 continue
-            
+
             # Upgrade old local placeholders (shoe1.jpg/cloth1.jpg/default image)
             # to valid URL images only when the current image reference is invalid.
             current_image = (existing.image or '').strip()
-            current_is_url = current_image.startswith(('http://', 'https://'))
-            current_local_exists = bool(current_image) and os.path.exists(
-                os.path.join(app.static_folder, 'images', current_image)
-            )
+            current_is_url = current_image.startswith(_URL_PREFIXES)
+            current_local_exists = current_image in _known_images
             should_upgrade_image = (
                 not current_image
                 or current_image == 'default-product.jpg'
                 or (not current_is_url and not current_local_exists)
             )
-            
-            if should_upgrade_image and sample.image:
-                existing.image = sample.image
-                images_updated += 1
-        
-        for product in products_to_add:
-            db.session.add(product)
-        
-        if products_to_add or images_updated:
+
+            if should_upgrade_image and sample.get('image'):
+                image_updates.append({'pid': existing.id, 'img': sample['image']})
+
+        if products_to_add:
+            # One executemany INSERT instead of per-object unit-of-work;
+            # the samples are plain column dicts so no ORM state is built
+            db.session.execute(insert(Product), products_to_add)
+
+        if image_updates:
+            # Batched by primary key: one executemany UPDATE instead of
+            # a flushed mutation per upgraded row
+            db.session.execute(
+                Product.__table__.update()
+                .where(Product.id == bindparam('pid'))
+                .values(image=bindparam('img')),
+                image_updates
+            )
+
+        if products_to_add or image_updates:
             db.session.commit()
-        
-        return len(products_to_add), images_updated
+
+        return len(products_to_add), len(image_updates)
     
     # ============================================================
     # CLI COMMANDS
     # ============================================================
     
+    def _print_seed_report(added_count, updated_images):
+        """Shared CLI reporting for the seed helpers."""
+        if added_count:
+            print(f'Added {added_count} sample products.')
+        if updated_images:
+            print(f'Updated images for {updated_images} existing products.')
+        if not added_count and not updated_images:
+            print('Sample products already up to date.')
+
     @app.cli.command('init-db')
     def init_db_command():
         """Initialize database tables, default admin, and sample products."""
         db.create_all()
-        
-        admin = User.query.filter_by(email='admin@jutta-lagani.com').first()
-        if not admin:
+        ensure_schema_indexes()
+        ensure_search_indexes()
+
+        # id-only probe: no need to hydrate the full row (password hash,
+        # address) just to test existence
+        admin_exists = db.session.query(User.id).filter_by(
+            email='admin@jutta-lagani.com').scalar() is not None
+        admin_created = False
+        if not admin_exists:
             admin = User(
                 username='admin',
                 email='admin@jutta-lagani.com',
@@ -1720,38 +2172,33 @@ def create_app(config_class=Config):
                 is_admin=True
             )
             admin.set_password('admin123')
+            # Left pending: the seeder's commit below flushes the admin
+            # in the same transaction, so cold init pays one fsync
             db.session.add(admin)
+            admin_created = True
+
+        added_count, updated_images = seed_sample_products()
+        if admin_created:
+            # Covers the case where the seeder had nothing to write
             db.session.commit()
             print('Default admin created: admin@jutta-lagani.com / admin123')
         else:
             print('Default admin already exists.')
-        
-        added_count, updated_images = seed_sample_products()
-        if added_count:
-            print(f'Added {added_count} sample products.')
-        if updated_images:
-            print(f'Updated images for {updated_images} existing products.')
-        if not added_count and not updated_images:
-            print('Sample products already up to date.')
-    
+        _print_seed_report(added_count, updated_images)
+
     @app.cli.command('seed-products')
     def seed_products_command():
         """Insert sample products if missing."""
         db.create_all()
-        added_count, updated_images = seed_sample_products()
-        if added_count:
-            print(f'Added {added_count} sample products.')
-        if updated_images:
-            print(f'Updated images for {updated_images} existing products.')
-        if not added_count and not updated_images:
-            print('No new sample products were added.')
+        _print_seed_report(*seed_sample_products())
     
     @app.cli.command('create-master-admin')
     def create_master_admin():
         """Create master admin user and ensure sample products exist."""
         db.create_all()
         
-        existing = User.query.filter_by(email='ghimirehimal72@gmail.com').first()
+        existing = db.session.query(User.id).filter_by(
+            email='ghimirehimal72@gmail.com').scalar() is not None
         if existing:
             print('Master admin already exists!')
         else:
@@ -1769,17 +2216,13 @@ def create_app(config_class=Config):
             print('Master admin created successfully!')
             print('Email: ghimirehimal72@gmail.com')
             print('Password: Prasad@06128@$')
-        
-        added_count, updated_images = seed_sample_products()
-        if added_count:
-            print(f'Added {added_count} sample products.')
-        if updated_images:
-            print(f'Updated images for {updated_images} existing products.')
-        if not added_count and not updated_images:
-            print('Sample products already up to date.')
+
+        _print_seed_report(*seed_sample_products())
     
-    # Expose helper for startup scripts (wsgi/main entrypoint).
+    # Expose helpers for startup scripts (wsgi/main entrypoint).
     app.seed_sample_products = seed_sample_products
+    app.ensure_schema_indexes = ensure_schema_indexes
+    app.ensure_search_indexes = ensure_search_indexes
     
     return app
 
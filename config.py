@@ -25,13 +25,64 @@ class Config:
     
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = False
+
+    # Enlarge the SQLAlchemy compiled-statement cache so the many
+    # filter/sort query variants used by the shop stay cached.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'query_cache_size': 1200,
+    }
+
+    # Connection pool tuning for production (PostgreSQL on Render).
+    # pool_pre_ping revalidates connections after DB restarts/idle
+    # timeouts instead of surfacing them as 500s; the sized pool keeps
+    # gunicorn workers from queueing on the default 5 connections.
+    if database_url:
+        SQLALCHEMY_ENGINE_OPTIONS.update({
+            'pool_size': 10,
+            'max_overflow': 10,
+            'pool_recycle': 1800,
+            'pool_pre_ping': True,
+            # Fail fast when the pool is exhausted instead of queueing
+            # requests for the default 30s
+            'pool_timeout': 10,
+        })
+    else:
+        # SQLite: wait out a concurrent writer (WAL checkpoint, seeder)
+        # instead of surfacing SQLITE_BUSY after the default 5s
+        SQLALCHEMY_ENGINE_OPTIONS.update({
+            'connect_args': {'timeout': 30},
+        })
     
+    # Caching (in-process SimpleCache by default; Redis when REDIS_URL is set)
+    REDIS_URL = os.environ.get('REDIS_URL')
+    if REDIS_URL:
+        CACHE_TYPE = 'RedisCache'
+        CACHE_REDIS_URL = REDIS_URL
+    else:
+        CACHE_TYPE = 'SimpleCache'
+    CACHE_DEFAULT_TIMEOUT = 300
+
+    # Response compression (Flask-Compress). Brotli when the client
+    # supports it, gzip otherwise; level 4 trades a little ratio for
+    # noticeably less CPU per response than the default 6.
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_MIN_SIZE = 500
+    COMPRESS_LEVEL = 4
+
     # Session Configuration
     SESSION_COOKIE_SECURE = False
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = 'Lax'
     PERMANENT_SESSION_LIFETIME = timedelta(days=7)
+    # Don't re-sign and re-send the session cookie on every response;
+    # it is only set again when the session actually changes.
+    SESSION_REFRESH_EACH_REQUEST = False
     
+    # Static files: let browsers cache CSS/JS/images instead of
+    # re-fetching them on every page view. Filenames aren't
+    # fingerprinted, so cap the age rather than using immutable/1y.
+    SEND_FILE_MAX_AGE_DEFAULT = timedelta(days=30)
+
     # Upload Configuration
     UPLOAD_FOLDER = 'static/images'
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
@@ -14,10 +14,30 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
+import os
 
 # Initialize SQLAlchemy
 db = SQLAlchemy()
 
+# Password hashing method, overridable so tests/CI can drop the pbkdf2
+# iteration count (e.g. PASSWORD_HASH_METHOD=pbkdf2:sha256:1000) without
+# touching the production default.
+_PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'pbkdf2:sha256')
+
+# Hash of a throwaway password, computed once at import. Used to equalize
+# login timing when no account matches the submitted email.
+_DUMMY_PASSWORD_HASH = generate_password_hash('not-a-real-password',
+                                              method=_PASSWORD_HASH_METHOD)
+
+
+def dummy_password_check(password):
+    """Burn the same hashing work as a real password check.
+
+    Called on login when no user matches the email, so response timing
+    does not reveal whether an address is registered.
+    """
+    return check_password_hash(_DUMMY_PASSWORD_HASH, password)
+
 
 class User(UserMixin, db.Model):
     """
@@ -41,8 +61,8 @@ class User(UserMixin, db.Model):
     is_master_admin = db.Column(db.Boolean, default=False)  # Only one master admin
     
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, server_default=db.func.now(), onupdate=datetime.utcnow)
     
     # Relationships
     orders = db.relationship('Order', backref='user', lazy=True, cascade='all, delete-orphan')
@@ -50,7 +70,8 @@ class User(UserMixin, db.Model):
     
     def set_password(self, password):
         """Hash and set the user password"""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password,
+                                                    method=_PASSWORD_HASH_METHOD)
     
     def check_password(self, password):
         """Verify the user password"""
@@ -99,21 +120,44 @@ class Product(db.Model):
     meta_description = db.Column(db.Text)
     
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, server_default=db.func.now(), onupdate=datetime.utcnow)
     
     # Relationships
     order_items = db.relationship('OrderItem', backref='product', lazy=True)
     cart_items = db.relationship('CartItem', backref='product', lazy=True, cascade='all, delete-orphan')
-    
+
+    # Composite indexes matching the shop listing: always filtered on
+    # is_available, optionally on category, sorted by newest or price.
+    # The plain (category, created_at) index serves the admin listing,
+    # which does not filter on availability.
+    __table_args__ = (
+        db.Index('ix_products_category_created', 'category', 'created_at'),
+        db.Index('ix_products_avail_cat_created', 'is_available', 'category', 'created_at'),
+        db.Index('ix_products_avail_cat_price', 'is_available', 'category', 'price'),
+        db.Index('ix_products_created_id', 'created_at', 'id'),
+    )
+
     def __repr__(self):
         return f'<Product {self.name}>'
-    
+
+    @property
+    def size_list(self):
+        """Parse the comma-separated size string into a clean list"""
+        if not self.size:
+            return []
+        return [s.strip() for s in self.size.split(',') if s.strip()]
+
     @property
     def discount_percentage(self):
         """Calculate discount percentage"""
-        if self.original_price and self.original_price > self.price:
-            return int(((self.original_price - self.price) / self.original_price) * 100)
+        # Hoist into locals: each self.<col> access goes through the
+        # InstrumentedAttribute descriptor, and this runs per product
+        # card on listing pages
+        original = self.original_price
+        price = self.price
+        if original and original > price:
+            return int((original - price) * 100 / original)
         return 0
 
 
@@ -148,15 +192,23 @@ class Order(db.Model):
     transaction_id = db.Column(db.String(100))
     
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, server_default=db.func.now(), index=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, server_default=db.func.now(), onupdate=datetime.utcnow)
     
     # Foreign Keys
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     
     # Relationships
     items = db.relationship('OrderItem', backref='order', lazy=True, cascade='all, delete-orphan')
-    
+
+    # Composite indexes matching the order-history listing (filter by
+    # user, sort by newest first) and the admin listing (newest first
+    # with id as a deterministic tie-breaker)
+    __table_args__ = (
+        db.Index('ix_orders_user_created', 'user_id', 'created_at'),
+        db.Index('ix_orders_created_id', 'created_at', 'id'),
+    )
+
     def __repr__(self):
         return f'<Order {self.order_number}>'
     
@@ -164,8 +216,11 @@ class Order(db.Model):
     def generate_order_number():
         """Generate unique order number"""
         from time import strftime
-        import random
-        return f'JL-{strftime("%Y%m%d")}-{random.randint(1000, 9999)}'
+        import secrets
+        # 32 bits of urandom entropy per day makes collisions (and the
+        # uniqueness retries they would cost) practically impossible;
+        # the unique order_number column stays as the hard guarantee.
+        return f'JL-{strftime("%Y%m%d")}-{secrets.token_hex(4).upper()}'
 
 
 class OrderItem(db.Model):
@@ -209,12 +264,14 @@ class CartItem(db.Model):
     color = db.Column(db.String(50))
     
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    
-    # Foreign Keys
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    product_id = db.Column(db.Integer, db.ForeignKey('products.id'), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, server_default=db.func.now())
     
+    # Foreign Keys (user_id indexed: hit by the cart page and the
+    # navbar count on every request; ON DELETE CASCADE lets backends
+    # that enforce FKs clean up cart rows when a product is removed)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    product_id = db.Column(db.Integer, db.ForeignKey('products.id', ondelete='CASCADE'), nullable=False)
+
     def __repr__(self):
         return f'<CartItem Product:{self.product_id} Quantity:{self.quantity}>'
     
@@ -236,14 +293,20 @@ class WishlistItem(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, server_default=db.func.now())
     
     # Foreign Keys
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    product_id = db.Column(db.Integer, db.ForeignKey('products.id'), nullable=False)
-    
+    product_id = db.Column(db.Integer, db.ForeignKey('products.id', ondelete='CASCADE'), nullable=False)
+
     # Relationships
     product = db.relationship('Product', backref='wishlist_items')
-    
+
+    # A product can appear only once per user's wishlist; lets the
+    # add route use INSERT ... ON CONFLICT DO NOTHING
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'product_id', name='uq_wishlist_user_product'),
+    )
+
     def __repr__(self):
         return f'<WishlistItem Product:{self.product_id} User:{self.user_id}>'
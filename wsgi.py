@@ -8,5 +8,9 @@ app = create_app()
 # Ensure tables exist on first boot (useful for fresh Render deployments).
 with app.app_context():
     db.create_all()
+    if hasattr(app, 'ensure_schema_indexes'):
+        app.ensure_schema_indexes()
+    if hasattr(app, 'ensure_search_indexes'):
+        app.ensure_search_indexes()
     if hasattr(app, 'seed_sample_products'):
         app.seed_sample_products()